@@ -16,7 +16,7 @@ try:
     cursor = cnx.cursor()
 
     # Check if admin user exists
-    cursor.execute("SELECT * FROM voters WHERE role = 'admin'")
+    cursor.execute("SELECT 1 FROM voters WHERE role = 'admin' LIMIT 1")
     admin_exists = cursor.fetchone()
 
     if not admin_exists:
@@ -30,10 +30,6 @@ try:
     else:
         print("Admin user already exists")
 
-    # Clear any unread results
-    while cnx.unread_result:
-        cursor.fetchall()
-
     # Show all users
     cursor.execute("SELECT * FROM voters")
     users = cursor.fetchall()
@@ -20,13 +20,16 @@ try:
     
     cursor = cnx.cursor()
     
-    # Add an admin user if it doesn't exist
-    cursor.execute("INSERT IGNORE INTO voters (voter_id, role, password) VALUES ('admin1', 'admin', 'admin123')")
-    cnx.commit()
-    print(f"Rows affected: {cursor.rowcount}")
-    
-    # Add a regular user if it doesn't exist
-    cursor.execute("INSERT IGNORE INTO voters (voter_id, role, password) VALUES ('user1', 'user', 'user123')")
+    # Add an admin user and a regular user if they don't exist
+    seed_users = [
+        ('admin1', 'admin', 'admin123'),
+        ('user1', 'user', 'user123'),
+    ]
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(seed_users))
+    cursor.execute(
+        f"INSERT IGNORE INTO voters (voter_id, role, password) VALUES {placeholders}",
+        [value for user in seed_users for value in user]
+    )
     cnx.commit()
     print(f"Rows affected: {cursor.rowcount}")
     
@@ -3,18 +3,172 @@ Enhanced API Endpoints
 Extends existing FastAPI endpoints with new feature support
 """
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Request, BackgroundTasks
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import io
 import uuid
 from datetime import datetime
+from decimal import Decimal
 import hashlib
-import json
+import os
+import time
+
+import aioboto3
+import asyncpg
+import orjson
+from PIL import Image
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
 
 # Import existing dependencies
-from .main import get_db_connection, verify_token
-
-router = APIRouter()
+from .main import verify_token
+
+# Connection pool settings
+DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', 5))
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 20))
+DB_POOL_ACQUIRE_TIMEOUT = 2.0  # seconds to wait for a free connection
+# Prepared statements are cached per connection, keyed on the SQL text.
+# Set DB_STATEMENT_CACHE_SIZE=0 when running behind pgbouncer in transaction mode.
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', 256))
+PLEDGE_STREAM_PREFETCH = 500  # rows fetched per server-side cursor round trip
+
+# Response cache settings
+CACHE_EXPIRE_SECONDS = 30
+TALLY_CACHE_EXPIRE_SECONDS = 5
+CANDIDATE_CACHE_NAMESPACE = "candidates"
+TALLY_CACHE_NAMESPACE = "tally"
+TENANT_CACHE_NAMESPACE = "tenants"
+
+# Photo processing settings
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', max((os.cpu_count() or 2) // 2, 1)))
+PHOTO_VARIANT_SIZES = {"thumb": 150, "medium": 600}  # longest edge in pixels
+PHOTO_JPEG_QUALITY = 85
+PHOTO_BUCKET = os.environ.get('AWS_S3_BUCKET')
+
+# Rating rate limit (per rater, per tenant)
+RATING_RATE_LIMIT = 10
+RATING_RATE_WINDOW_SECONDS = 24 * 60 * 60
+
+async def _init_connection(conn: asyncpg.Connection):
+    """Decode json/jsonb to Python objects and UUIDs to str on every pooled connection"""
+    for json_type in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            json_type,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema='pg_catalog'
+        )
+    # The response models declare ids as str, as psycopg2 returned them
+    await conn.set_type_codec('uuid', encoder=str, decoder=str, schema='pg_catalog')
+
+@asynccontextmanager
+async def lifespan(app):
+    """Set up shared resources (DB pool, Redis cache, image workers, S3 session) and tear them down on shutdown"""
+    app.state.pool = await asyncpg.create_pool(
+        dsn=os.environ['DATABASE_URL'],
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+        max_cached_statement_lifetime=0,
+        init=_init_connection
+    )
+    app.state.redis = aioredis.from_url(os.environ.get('REDIS_URL', 'redis://localhost:6379'))
+    FastAPICache.init(RedisBackend(app.state.redis), prefix="enhanced-cache")
+    app.state.image_pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+    app.state.s3_session = aioboto3.Session()
+    try:
+        yield
+    finally:
+        await app.state.pool.close()
+        await app.state.redis.close()
+        app.state.image_pool.shutdown()
+
+# The lifespan is merged into the app by app.include_router(router)
+router = APIRouter(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+async def _get_db_pool(request: Request) -> asyncpg.Pool:
+    """Return the application-wide connection pool"""
+    return request.app.state.pool
+
+async def _get_redis(request: Request) -> aioredis.Redis:
+    """Return the application-wide Redis client"""
+    return request.app.state.redis
+
+async def _get_connection_from_pool(pool: asyncpg.Pool = Depends(_get_db_pool)):
+    """Borrow a connection for the duration of the request"""
+    async with pool.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT) as conn:
+        yield conn
+
+async def _get_db_with_commit(conn=Depends(_get_connection_from_pool)):
+    """Run the handler in a transaction; use with scope="function" to commit before the response"""
+    async with conn.transaction():
+        yield conn
+
+def _invalidate_after_response(namespace: str, func_name: str):
+    """Build a dependency yielding a list; cache entries for the params appended to it are deleted after the response"""
+    async def invalidate():
+        stale = []
+        yield stale
+        for params in stale:
+            await _invalidate_cached(namespace, func_name, **params)
+    return invalidate
+
+async def _record_rating_rate_limit(pool: asyncpg.Pool, rater_id: str, tenant_id: str):
+    """Mirror a rating into the rate_limits table for audit and export"""
+    query = """
+    INSERT INTO rate_limits (rater_id, tenant_id, action_type, count, reset_time)
+    VALUES ($1, $2, 'rating', 1, CURRENT_DATE + INTERVAL '1 day')
+    ON CONFLICT (rater_id, tenant_id, action_type) DO UPDATE SET
+        count = rate_limits.count + 1
+    """
+    
+    async with pool.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT) as conn:
+        await conn.execute(query, rater_id, tenant_id)
+
+def _cache_key_suffix(func_name: str, params: Dict[str, Any]) -> str:
+    """Readable cache key suffix, so a single entry can be deleted without scanning Redis"""
+    return func_name + "".join(f":{key}={params[key]}" for key in sorted(params))
+
+def _no_db_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None):
+    """Build cache keys from endpoint arguments, ignoring injected database handles"""
+    params = {key: value for key, value in (kwargs or {}).items() if key not in ('db', 'pool')}
+    return f"{namespace}:{_cache_key_suffix(func.__name__, params)}"
+
+async def _invalidate_cached(namespace: str, func_name: str, **params):
+    """Delete one cached response by key (a namespace-wide clear runs KEYS over all of Redis)"""
+    key = f"{FastAPICache.get_prefix()}:{namespace}:{_cache_key_suffix(func_name, params)}"
+    await FastAPICache.get_backend().clear(key=key)
+
+def _process_image(content: bytes) -> Dict[str, bytes]:
+    """Render resized JPEG variants of an uploaded photo (runs in a worker process)"""
+    variants = {}
+    with Image.open(io.BytesIO(content)) as image:
+        image = image.convert("RGB")
+        for name, size in PHOTO_VARIANT_SIZES.items():
+            variant = image.copy()
+            variant.thumbnail((size, size), Image.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, format="JPEG", quality=PHOTO_JPEG_QUALITY, optimize=True)
+            variants[name] = buffer.getvalue()
+    return variants
+
+async def _store_photo_files(session, files: Dict[str, tuple]):
+    """Upload photo files to object storage concurrently; files maps key -> (body, content type)"""
+    if not PHOTO_BUCKET:
+        return
+    
+    async with session.client("s3", region_name=os.environ.get('AWS_REGION')) as s3:
+        await asyncio.gather(*[
+            s3.put_object(Bucket=PHOTO_BUCKET, Key=key, Body=body, ContentType=content_type)
+            for key, (body, content_type) in files.items()
+        ])
 
 # Pydantic Models for Enhanced Features
 
@@ -81,10 +235,10 @@ class VoteConfirmationCreate(BaseModel):
 
 # Enhanced Candidate Endpoints
 
-@router.post("/candidates/enhanced", response_model=EnhancedCandidateResponse)
+@router.post("/candidates/enhanced", response_model=EnhancedCandidateResponse, response_model_exclude_unset=True)
 async def create_enhanced_candidate(
     candidate: EnhancedCandidateCreate,
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Create enhanced candidate with additional metadata"""
@@ -93,51 +247,43 @@ async def create_enhanced_candidate(
         
         query = """
         INSERT INTO candidates (id, name, election_id, title, affiliation, short_summary, metadata)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (
+        await db.fetchrow(
+            query,
             candidate_id,
             candidate.name,
             candidate.election_id,
             candidate.title,
             candidate.affiliation,
             candidate.short_summary,
-            json.dumps(candidate.metadata)
-        ))
-        
-        result = cursor.fetchone()
-        db.commit()
+            candidate.metadata
+        )
         
-        # Get enhanced candidate data
-        return await get_enhanced_candidate(candidate_id, db)
+        # Get enhanced candidate data (by keyword, so it caches under the same key as GETs)
+        return await get_enhanced_candidate(candidate_id=candidate_id, db=db)
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create candidate: {str(e)}")
 
-@router.get("/candidates/{candidate_id}/enhanced", response_model=EnhancedCandidateResponse)
-async def get_enhanced_candidate(candidate_id: str, db=Depends(get_db_connection)):
+@router.get("/candidates/{candidate_id}/enhanced", response_model=EnhancedCandidateResponse, response_model_exclude_unset=True)
+@cache(expire=CACHE_EXPIRE_SECONDS, namespace=CANDIDATE_CACHE_NAMESPACE, key_builder=_no_db_key_builder)
+async def get_enhanced_candidate(candidate_id: str, db=Depends(_get_connection_from_pool)):
     """Get enhanced candidate with all related data"""
     try:
         query = """
-        SELECT * FROM enhanced_candidates WHERE id = %s
+        SELECT * FROM enhanced_candidates WHERE id = $1
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (candidate_id,))
-        result = cursor.fetchone()
+        result = await db.fetchrow(query, candidate_id)
         
         if not result:
             raise HTTPException(status_code=404, detail="Candidate not found")
         
-        # Convert to response model
-        columns = [desc[0] for desc in cursor.description]
-        candidate_data = dict(zip(columns, result))
-        
-        return EnhancedCandidateResponse(**candidate_data)
+        # Returned as a plain dict so FastAPI validates against response_model only once
+        return dict(result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get candidate: {str(e)}")
@@ -145,9 +291,10 @@ async def get_enhanced_candidate(candidate_id: str, db=Depends(get_db_connection
 @router.post("/candidates/{candidate_id}/photo")
 async def upload_candidate_photo(
     candidate_id: str,
+    request: Request,
     photo: UploadFile = File(...),
     alt_text: str = Form(...),
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Upload candidate photo with processing"""
@@ -162,12 +309,22 @@ async def upload_candidate_photo(
         # Read file content
         content = await photo.read()
         
-        # Generate hash
-        file_hash = hashlib.sha256(content).hexdigest()
-        
-        # In production, process and store images (resize, compress, upload to CDN)
-        # For now, simulate URLs
-        base_url = f"/api/photos/{candidate_id}/{file_hash}"
+        # Hash on a thread (hashlib releases the GIL on large buffers) while
+        # the CPU-bound resizing runs in the process pool
+        loop = asyncio.get_running_loop()
+        file_hash, variants = await asyncio.gather(
+            asyncio.to_thread(lambda: hashlib.sha256(content).hexdigest()),
+            loop.run_in_executor(request.app.state.image_pool, _process_image, content)
+        )
+        
+        photo_key = f"photos/{candidate_id}/{file_hash}"
+        await _store_photo_files(request.app.state.s3_session, {
+            f"{photo_key}/original.jpg": (content, photo.content_type),
+            f"{photo_key}/thumb.jpg": (variants["thumb"], "image/jpeg"),
+            f"{photo_key}/medium.jpg": (variants["medium"], "image/jpeg")
+        })
+        
+        base_url = f"/api/{photo_key}"
         original_url = f"{base_url}/original.jpg"
         thumbnail_url = f"{base_url}/thumb.jpg"
         medium_url = f"{base_url}/medium.jpg"
@@ -175,39 +332,39 @@ async def upload_candidate_photo(
         # Store photo record
         photo_query = """
         INSERT INTO candidate_photos (candidate_id, original_url, thumbnail_url, medium_url, hash, alt_text, file_size, mime_type)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
         ON CONFLICT (hash) DO UPDATE SET
             alt_text = EXCLUDED.alt_text,
             uploaded_at = CURRENT_TIMESTAMP
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(photo_query, (
-            candidate_id,
-            original_url,
-            thumbnail_url,
-            medium_url,
-            file_hash,
-            alt_text,
-            len(content),
-            photo.content_type
-        ))
-        
-        photo_result = cursor.fetchone()
-        
         # Update candidate with photo reference
         update_query = """
         UPDATE candidates SET 
-            photo_url = %s,
-            photo_hash = %s,
-            photo_alt_text = %s,
+            photo_url = $1,
+            photo_hash = $2,
+            photo_alt_text = $3,
             updated_at = CURRENT_TIMESTAMP
-        WHERE id = %s
+        WHERE id = $4
         """
         
-        cursor.execute(update_query, (original_url, file_hash, alt_text, candidate_id))
-        db.commit()
+        async with db.transaction():
+            photo_result = await db.fetchrow(
+                photo_query,
+                candidate_id,
+                original_url,
+                thumbnail_url,
+                medium_url,
+                file_hash,
+                alt_text,
+                len(content),
+                photo.content_type
+            )
+            
+            await db.execute(update_query, original_url, file_hash, alt_text, candidate_id)
+        
+        await _invalidate_cached(CANDIDATE_CACHE_NAMESPACE, "get_enhanced_candidate", candidate_id=candidate_id)
         
         return {
             "message": "Photo uploaded successfully",
@@ -217,100 +374,99 @@ async def upload_candidate_photo(
         }
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to upload photo: {str(e)}")
 
 # Manifesto Endpoints
 
-@router.post("/manifestos", response_model=ManifestoResponse)
+@router.post("/manifestos", response_model=ManifestoResponse, response_model_exclude_unset=True)
 async def create_manifesto(
     manifesto: ManifestoCreate,
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Create candidate manifesto"""
     try:
-        manifesto_id = f"manifesto_{manifesto.candidate_id}_{int(datetime.now().timestamp())}"
+        now_ts = int(time.time())
+        manifesto_id = f"manifesto_{manifesto.candidate_id}_{now_ts}"
         
         # Calculate content hash
         content_hash = hashlib.sha256(manifesto.content.encode()).hexdigest()
         
-        # Get next version number
-        version_query = """
-        SELECT COALESCE(MAX(version), 0) + 1 as next_version
-        FROM candidate_manifestos
-        WHERE candidate_id = %s
-        """
-        
-        cursor = db.cursor()
-        cursor.execute(version_query, (manifesto.candidate_id,))
-        version = cursor.fetchone()[0]
-        
-        # Insert manifesto
-        manifesto_query = """
-        INSERT INTO candidate_manifestos (manifesto_id, candidate_id, tenant_id, content, version, hash)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        RETURNING *
-        """
-        
-        cursor.execute(manifesto_query, (
-            manifesto_id,
-            manifesto.candidate_id,
-            manifesto.tenant_id,
-            manifesto.content,
-            version,
-            content_hash
-        ))
-        
-        manifesto_result = cursor.fetchone()
-        
-        # Insert pledges if provided
-        pledge_results = []
-        for pledge_data in manifesto.pledges:
-            pledge_id = f"pledge_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}"
-            
-            pledge_query = """
-            INSERT INTO manifesto_pledges (pledge_id, manifesto_id, title, description, category, priority)
-            VALUES (%s, %s, %s, %s, %s, %s)
+        async with db.transaction():
+            # Insert manifesto, computing the next version number in the same statement
+            manifesto_query = """
+            INSERT INTO candidate_manifestos (manifesto_id, candidate_id, tenant_id, content, version, hash)
+            SELECT $1, $2, $3, $4, COALESCE(MAX(version), 0) + 1, $5
+            FROM candidate_manifestos
+            WHERE candidate_id = $2
             RETURNING *
             """
             
-            cursor.execute(pledge_query, (
-                pledge_id,
+            manifesto_result = await db.fetchrow(
+                manifesto_query,
                 manifesto_id,
-                pledge_data.get('title', ''),
-                pledge_data.get('description', ''),
-                pledge_data.get('category', 'general'),
-                pledge_data.get('priority', 'medium')
-            ))
+                manifesto.candidate_id,
+                manifesto.tenant_id,
+                manifesto.content,
+                content_hash
+            )
             
-            pledge_results.append(dict(zip([desc[0] for desc in cursor.description], cursor.fetchone())))
-        
-        # Update candidate with manifesto reference
-        update_query = """
-        UPDATE candidates SET manifesto_id = %s, updated_at = CURRENT_TIMESTAMP
-        WHERE id = %s
-        """
+            # Insert pledges if provided, as a single multi-row statement
+            pledge_results = []
+            if manifesto.pledges:
+                # One random suffix per manifesto; the counter keeps pledge ids unique
+                pledge_base = uuid.uuid4().hex[:8]
+                pledge_rows = [
+                    (
+                        f"pledge_{now_ts}_{i:04x}_{pledge_base}",
+                        pledge_data.get('title', ''),
+                        pledge_data.get('description', ''),
+                        pledge_data.get('category', 'general'),
+                        pledge_data.get('priority', 'medium')
+                    )
+                    for i, pledge_data in enumerate(manifesto.pledges)
+                ]
+                
+                pledge_query = """
+                INSERT INTO manifesto_pledges (pledge_id, manifesto_id, title, description, category, priority)
+                SELECT p.pledge_id, $1, p.title, p.description, p.category, p.priority
+                FROM unnest($2::varchar[], $3::varchar[], $4::text[], $5::varchar[], $6::varchar[])
+                    AS p(pledge_id, title, description, category, priority)
+                RETURNING *
+                """
+                
+                pledge_records = await db.fetch(
+                    pledge_query,
+                    manifesto_id,
+                    *[list(column) for column in zip(*pledge_rows)]
+                )
+                
+                pledge_results = [dict(record) for record in pledge_records]
+            
+            # Update candidate with manifesto reference
+            update_query = """
+            UPDATE candidates SET manifesto_id = $1, updated_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+            """
+            
+            await db.execute(update_query, manifesto_id, manifesto.candidate_id)
         
-        cursor.execute(update_query, (manifesto_id, manifesto.candidate_id))
-        db.commit()
+        await _invalidate_cached(CANDIDATE_CACHE_NAMESPACE, "get_enhanced_candidate", candidate_id=manifesto.candidate_id)
         
         # Return response
-        columns = [desc[0] for desc in cursor.description]
-        manifesto_data = dict(zip(columns, manifesto_result))
+        manifesto_data = dict(manifesto_result)
         manifesto_data['pledges'] = pledge_results
         manifesto_data['attachments'] = []
         
-        return ManifestoResponse(**manifesto_data)
+        return manifesto_data
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create manifesto: {str(e)}")
 
 @router.put("/manifestos/{manifesto_id}/publish")
 async def publish_manifesto(
     manifesto_id: str,
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Publish manifesto"""
@@ -318,25 +474,22 @@ async def publish_manifesto(
         query = """
         UPDATE candidate_manifestos 
         SET published = true, published_at = CURRENT_TIMESTAMP
-        WHERE manifesto_id = %s
+        WHERE manifesto_id = $1
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (manifesto_id,))
-        result = cursor.fetchone()
+        result = await db.fetchrow(query, manifesto_id)
         
         if not result:
             raise HTTPException(status_code=404, detail="Manifesto not found")
         
-        db.commit()
+        await _invalidate_cached(CANDIDATE_CACHE_NAMESPACE, "get_enhanced_candidate", candidate_id=result['candidate_id'])
         
         # TODO: Anchor content hash on blockchain
         
         return {"message": "Manifesto published successfully"}
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to publish manifesto: {str(e)}")
 
 # Live Tally Endpoints
@@ -344,14 +497,15 @@ async def publish_manifesto(
 @router.post("/tally/configure")
 async def configure_tally(
     config: TallyConfigurationCreate,
-    db=Depends(get_db_connection),
+    db=Depends(_get_db_with_commit, scope="function"),
+    stale_tallies=Depends(_invalidate_after_response(TALLY_CACHE_NAMESPACE, "_get_latest_tally")),
     current_user=Depends(verify_token)
 ):
     """Configure live tally for election"""
     try:
         query = """
         INSERT INTO tally_configurations (tenant_id, election_id, mode, delay_minutes, enable_deltas, delta_interval)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5, $6)
         ON CONFLICT (tenant_id, election_id) DO UPDATE SET
             mode = EXCLUDED.mode,
             delay_minutes = EXCLUDED.delay_minutes,
@@ -361,48 +515,72 @@ async def configure_tally(
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (
+        await db.fetchrow(
+            query,
             config.tenant_id,
             config.election_id,
             config.mode,
             config.delay_minutes,
             config.enable_deltas,
             config.delta_interval
-        ))
+        )
         
-        result = cursor.fetchone()
-        db.commit()
+        # Dropped from the cache once the response is sent, after the commit
+        stale_tallies.append({"election_id": config.election_id})
         
         return {"message": "Tally configuration updated successfully"}
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to configure tally: {str(e)}")
 
+@cache(expire=TALLY_CACHE_EXPIRE_SECONDS, namespace=TALLY_CACHE_NAMESPACE, key_builder=_no_db_key_builder)
+async def _get_latest_tally(election_id: str, db) -> Dict[str, Any]:
+    """Build the tally payload from the latest snapshot; cached, access checks happen in the caller"""
+    snapshot_query = """
+    SELECT total_votes, candidate_data, deltas, timestamp
+    FROM tally_history
+    WHERE election_id = $1
+    ORDER BY timestamp DESC
+    LIMIT 1
+    """
+    
+    snapshot = await db.fetchrow(snapshot_query, election_id)
+    
+    if not snapshot:
+        return {
+            "election_id": election_id,
+            "total_votes": 0,
+            "candidates": [],
+            "last_update": None
+        }
+    
+    return {
+        "election_id": election_id,
+        "total_votes": snapshot['total_votes'],
+        "candidates": snapshot['candidate_data'],
+        "deltas": snapshot['deltas'] or [],
+        "last_update": snapshot['timestamp']
+    }
+
 @router.get("/tally/{election_id}")
 async def get_live_tally(
     election_id: str,
     role: str = "voter",
-    db=Depends(get_db_connection)
+    db=Depends(_get_connection_from_pool)
 ):
     """Get current live tally for election"""
     try:
-        # Check tally configuration
+        # The access mode is read on every request so a restricted or
+        # disabled tally is never served from the cache
         config_query = """
-        SELECT * FROM tally_configurations 
-        WHERE election_id = %s
+        SELECT mode FROM tally_configurations WHERE election_id = $1
         """
         
-        cursor = db.cursor()
-        cursor.execute(config_query, (election_id,))
-        config = cursor.fetchone()
+        mode = await db.fetchval(config_query, election_id)
         
-        if not config:
+        if mode is None:
             raise HTTPException(status_code=404, detail="Tally configuration not found")
         
-        mode = config[3]  # mode column
-        
         # Check access permissions
         if mode == 'disabled':
             raise HTTPException(status_code=403, detail="Tally disabled for this election")
@@ -410,35 +588,7 @@ async def get_live_tally(
         if mode == 'admin_only' and role != 'admin':
             raise HTTPException(status_code=403, detail="Tally access restricted to admins")
         
-        # Get latest tally data
-        tally_query = """
-        SELECT * FROM tally_history 
-        WHERE election_id = %s 
-        ORDER BY timestamp DESC 
-        LIMIT 1
-        """
-        
-        cursor.execute(tally_query, (election_id,))
-        tally_result = cursor.fetchone()
-        
-        if not tally_result:
-            return {
-                "election_id": election_id,
-                "total_votes": 0,
-                "candidates": [],
-                "last_update": None
-            }
-        
-        columns = [desc[0] for desc in cursor.description]
-        tally_data = dict(zip(columns, tally_result))
-        
-        return {
-            "election_id": election_id,
-            "total_votes": tally_data['total_votes'],
-            "candidates": json.loads(tally_data['candidate_data']),
-            "deltas": json.loads(tally_data.get('deltas', '[]')),
-            "last_update": tally_data['timestamp']
-        }
+        return await _get_latest_tally(election_id=election_id, db=db)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get tally: {str(e)}")
@@ -450,141 +600,136 @@ async def submit_pledge_rating(
     rating: PledgeRatingCreate,
     rater_id: str,
     tenant_id: str,
-    db=Depends(get_db_connection),
+    background_tasks: BackgroundTasks,
+    db=Depends(_get_db_with_commit, scope="function"),
+    pool=Depends(_get_db_pool),
+    redis=Depends(_get_redis),
     current_user=Depends(verify_token)
 ):
     """Submit pledge performance rating"""
     try:
-        # Check rate limiting
-        rate_limit_query = """
-        SELECT count FROM rate_limits 
-        WHERE rater_id = %s AND tenant_id = %s AND action_type = 'rating'
-        AND reset_time > CURRENT_TIMESTAMP
-        """
-        
-        cursor = db.cursor()
-        cursor.execute(rate_limit_query, (rater_id, tenant_id))
-        rate_limit = cursor.fetchone()
-        
-        if rate_limit and rate_limit[0] >= 10:  # Default limit
+        # Check rate limiting with a single pipelined Redis round trip
+        rate_limit_key = f"rl:{tenant_id}:{rater_id}:rating"
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.incr(rate_limit_key)
+            pipe.expire(rate_limit_key, RATING_RATE_WINDOW_SECONDS, nx=True)
+            rate_count, _ = await pipe.execute()
+        
+        if rate_count > RATING_RATE_LIMIT:
             raise HTTPException(status_code=429, detail="Rate limit exceeded")
         
-        # Check for existing rating
-        existing_query = """
-        SELECT id FROM pledge_ratings 
-        WHERE tenant_id = %s AND pledge_id = %s AND rater_id = %s AND rating_period = %s
-        """
-        
-        cursor.execute(existing_query, (
-            tenant_id,
-            rating.pledge_id,
-            rater_id,
-            rating.rating_period
-        ))
-        
-        if cursor.fetchone():
-            raise HTTPException(status_code=400, detail="Rating already submitted for this period")
-        
-        # Insert rating
-        rating_id = f"rating_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}"
-        
-        insert_query = """
-        INSERT INTO pledge_ratings (rating_id, tenant_id, candidate_id, pledge_id, rater_id, score, rating_period)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        RETURNING *
-        """
-        
-        cursor.execute(insert_query, (
-            rating_id,
-            tenant_id,
-            rating.candidate_id,
-            rating.pledge_id,
-            rater_id,
-            rating.score,
-            rating.rating_period
-        ))
-        
-        # Update rate limit
-        rate_limit_upsert = """
-        INSERT INTO rate_limits (rater_id, tenant_id, action_type, count, reset_time)
-        VALUES (%s, %s, 'rating', 1, CURRENT_DATE + INTERVAL '1 day')
-        ON CONFLICT (rater_id, tenant_id, action_type) DO UPDATE SET
-            count = rate_limits.count + 1
-        """
-        
-        cursor.execute(rate_limit_upsert, (rater_id, tenant_id))
-        
-        # Update performance cache (simplified)
-        update_performance_query = """
+        rating_id = f"rating_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        
+        # Insert rating and update the performance cache (simplified) as a
+        # single statement. The unique index on
+        # (tenant_id, pledge_id, rater_id, rating_period) turns a duplicate
+        # into an empty new_rating, so nothing else is written.
+        submit_query = """
+        WITH new_rating AS (
+            INSERT INTO pledge_ratings (rating_id, tenant_id, candidate_id, pledge_id, rater_id, score, rating_period)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (tenant_id, pledge_id, rater_id, rating_period) DO NOTHING
+            RETURNING pledge_id, candidate_id, score
+        )
         INSERT INTO pledge_performances (pledge_id, candidate_id, average_score, total_ratings)
-        VALUES (%s, %s, %s, 1)
+        SELECT pledge_id, candidate_id, score, 1 FROM new_rating
         ON CONFLICT (pledge_id) DO UPDATE SET
-            average_score = (pledge_performances.average_score * pledge_performances.total_ratings + %s) / (pledge_performances.total_ratings + 1),
+            average_score = (pledge_performances.average_score * pledge_performances.total_ratings + EXCLUDED.average_score) / (pledge_performances.total_ratings + 1),
             total_ratings = pledge_performances.total_ratings + 1,
             last_updated = CURRENT_TIMESTAMP
+        RETURNING pledge_id
         """
         
-        cursor.execute(update_performance_query, (
-            rating.pledge_id,
-            rating.candidate_id,
-            rating.score,
-            rating.score
-        ))
+        try:
+            submitted = await db.fetchval(
+                submit_query,
+                rating_id,
+                tenant_id,
+                rating.candidate_id,
+                rating.pledge_id,
+                rater_id,
+                rating.score,
+                rating.rating_period
+            )
+        except Exception:
+            # A failed write must not use up one of the rater's slots
+            await redis.decr(rate_limit_key)
+            raise
+        
+        if submitted is None:
+            # Duplicates don't count against the limit
+            await redis.decr(rate_limit_key)
+            raise HTTPException(status_code=400, detail="Rating already submitted for this period")
         
-        db.commit()
+        background_tasks.add_task(_record_rating_rate_limit, pool, rater_id, tenant_id)
         
         return {"message": "Rating submitted successfully", "rating_id": rating_id}
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to submit rating: {str(e)}")
 
+def _ndjson_default(value):
+    """orjson fallback: NUMERIC aggregates stay JSON numbers, like the row_to_json pledge lines"""
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+async def _stream_pledge_performances(pool: asyncpg.Pool, candidate_id: str, performance_data: Dict[str, Any]):
+    """Yield the performance summary, then one NDJSON line per pledge"""
+    yield orjson.dumps(performance_data, default=_ndjson_default) + b"\n"
+    
+    # Rows are serialised by Postgres, so each one is passed through as-is
+    pledge_query = """
+    SELECT row_to_json(p)::text AS pledge
+    FROM (
+        SELECT pp.*, mp.title, mp.description, mp.category
+        FROM pledge_performances pp
+        JOIN manifesto_pledges mp ON pp.pledge_id = mp.pledge_id
+        WHERE pp.candidate_id = $1
+    ) p
+    """
+    
+    # Server-side cursors need a transaction. The handler's connection is
+    # released before streaming starts, so the stream holds the only one.
+    async with pool.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT) as conn:
+        async with conn.transaction():
+            async for row in conn.cursor(pledge_query, candidate_id, prefetch=PLEDGE_STREAM_PREFETCH):
+                yield row[0].encode() + b"\n"
+
 @router.get("/candidates/{candidate_id}/performance")
 async def get_candidate_performance(
     candidate_id: str,
     tenant_id: str,
-    db=Depends(get_db_connection)
+    db=Depends(_get_connection_from_pool, scope="function"),
+    pool=Depends(_get_db_pool)
 ):
-    """Get candidate performance summary"""
+    """Stream candidate performance summary followed by pledge performances as NDJSON"""
     try:
         query = """
         SELECT * FROM candidate_performance_summary 
-        WHERE candidate_id = %s
+        WHERE candidate_id = $1
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (candidate_id,))
-        result = cursor.fetchone()
+        result = await db.fetchrow(query, candidate_id)
         
         if not result:
-            return {
+            empty_summary = {
                 "candidate_id": candidate_id,
                 "overall_score": 0,
                 "total_pledges": 0,
-                "total_ratings": 0,
-                "pledge_performances": []
+                "total_ratings": 0
             }
+            return StreamingResponse(
+                iter([orjson.dumps(empty_summary) + b"\n"]),
+                media_type="application/x-ndjson"
+            )
         
-        columns = [desc[0] for desc in cursor.description]
-        performance_data = dict(zip(columns, result))
+        performance_data = dict(result)
         
-        # Get detailed pledge performances
-        pledge_query = """
-        SELECT pp.*, mp.title, mp.description, mp.category
-        FROM pledge_performances pp
-        JOIN manifesto_pledges mp ON pp.pledge_id = mp.pledge_id
-        WHERE pp.candidate_id = %s
-        """
-        
-        cursor.execute(pledge_query, (candidate_id,))
-        pledge_results = cursor.fetchall()
-        
-        pledge_columns = [desc[0] for desc in cursor.description]
-        pledge_performances = [dict(zip(pledge_columns, row)) for row in pledge_results]
-        
-        performance_data['pledge_performances'] = pledge_performances
-        
-        return performance_data
+        return StreamingResponse(
+            _stream_pledge_performances(pool, candidate_id, performance_data),
+            media_type="application/x-ndjson"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get performance: {str(e)}")
@@ -594,44 +739,40 @@ async def get_candidate_performance(
 @router.post("/votes/confirm")
 async def create_vote_confirmation(
     confirmation: VoteConfirmationCreate,
-    db=Depends(get_db_connection),
+    db=Depends(_get_db_with_commit, scope="function"),
     current_user=Depends(verify_token)
 ):
     """Create vote confirmation with grace period"""
     try:
-        vote_id = f"vote_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}"
-        grace_period_end = datetime.now().timestamp() + confirmation.grace_period_seconds
+        now = time.time()
+        vote_id = f"vote_{int(now)}_{uuid.uuid4().hex[:8]}"
+        grace_period_end = now + confirmation.grace_period_seconds
         
         query = """
         INSERT INTO vote_confirmations (vote_id, candidate_id, candidate_name, grace_period_end)
-        VALUES (%s, %s, %s, to_timestamp(%s))
+        VALUES ($1, $2, $3, to_timestamp($4))
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (
+        result = await db.fetchrow(
+            query,
             vote_id,
             confirmation.candidate_id,
             confirmation.candidate_name,
             grace_period_end
-        ))
-        
-        result = cursor.fetchone()
-        db.commit()
+        )
         
-        columns = [desc[0] for desc in cursor.description]
-        confirmation_data = dict(zip(columns, result))
+        confirmation_data = dict(result)
         
         return confirmation_data
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create confirmation: {str(e)}")
 
 @router.put("/votes/{vote_id}/undo")
 async def undo_vote(
     vote_id: str,
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Undo vote during grace period"""
@@ -639,26 +780,21 @@ async def undo_vote(
         query = """
         UPDATE vote_confirmations 
         SET undone = true 
-        WHERE vote_id = %s 
+        WHERE vote_id = $1 
         AND grace_period_end > CURRENT_TIMESTAMP 
         AND confirmed = false 
         AND undone = false
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (vote_id,))
-        result = cursor.fetchone()
+        result = await db.fetchrow(query, vote_id)
         
         if not result:
             raise HTTPException(status_code=400, detail="Cannot undo vote (expired or already processed)")
         
-        db.commit()
-        
         return {"message": "Vote undone successfully"}
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to undo vote: {str(e)}")
 
 # Tenant Configuration Endpoints
@@ -666,14 +802,14 @@ async def undo_vote(
 @router.post("/tenants/configure")
 async def configure_tenant(
     tenant_config: Dict[str, Any],
-    db=Depends(get_db_connection),
+    db=Depends(_get_connection_from_pool),
     current_user=Depends(verify_token)
 ):
     """Configure tenant features and settings"""
     try:
         query = """
         INSERT INTO tenant_configurations (tenant_id, organization_name, features, settings, data_region)
-        VALUES (%s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5)
         ON CONFLICT (tenant_id) DO UPDATE SET
             organization_name = EXCLUDED.organization_name,
             features = EXCLUDED.features,
@@ -683,74 +819,95 @@ async def configure_tenant(
         RETURNING *
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (
+        await db.fetchrow(
+            query,
             tenant_config['tenant_id'],
             tenant_config['organization_name'],
-            json.dumps(tenant_config['features']),
-            json.dumps(tenant_config['settings']),
+            tenant_config['features'],
+            tenant_config['settings'],
             tenant_config.get('data_region', 'global')
-        ))
+        )
         
-        result = cursor.fetchone()
-        db.commit()
+        await _invalidate_cached(TENANT_CACHE_NAMESPACE, "get_tenant_config", tenant_id=tenant_config['tenant_id'])
         
         return {"message": "Tenant configured successfully"}
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to configure tenant: {str(e)}")
 
 @router.get("/tenants/{tenant_id}/config")
+@cache(expire=CACHE_EXPIRE_SECONDS, namespace=TENANT_CACHE_NAMESPACE, key_builder=_no_db_key_builder)
 async def get_tenant_config(
     tenant_id: str,
-    db=Depends(get_db_connection)
+    db=Depends(_get_connection_from_pool)
 ):
     """Get tenant configuration"""
     try:
         query = """
-        SELECT * FROM tenant_configurations WHERE tenant_id = %s
+        SELECT * FROM tenant_configurations WHERE tenant_id = $1
         """
         
-        cursor = db.cursor()
-        cursor.execute(query, (tenant_id,))
-        result = cursor.fetchone()
+        result = await db.fetchrow(query, tenant_id)
         
         if not result:
             raise HTTPException(status_code=404, detail="Tenant configuration not found")
         
-        columns = [desc[0] for desc in cursor.description]
-        config_data = dict(zip(columns, result))
-        
-        # Parse JSON fields
-        config_data['features'] = json.loads(config_data['features'])
-        config_data['settings'] = json.loads(config_data['settings'])
-        
-        return config_data
+        # json/jsonb columns arrive already decoded by the pool's type codecs
+        return dict(result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get tenant config: {str(e)}")
 
 # Health Check and Status Endpoints
 
+# Only these names are ever interpolated into COUNT(*) queries
+HEALTH_CHECK_TABLES = (
+    'candidate_photos', 'candidate_manifestos', 'manifesto_pledges',
+    'tally_configurations', 'vote_commitments', 'pledge_ratings',
+    'tenant_configurations'
+)
+
+async def _exact_table_count(pool: asyncpg.Pool, table: str) -> int:
+    """Run an exact COUNT(*) on its own pooled connection so counts can run concurrently"""
+    if table not in HEALTH_CHECK_TABLES:
+        raise ValueError(f"Table not allowed in health check: {table}")
+    
+    async with pool.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT) as conn:
+        return await conn.fetchval(f"SELECT COUNT(*) FROM public.{table}")
+
 @router.get("/health/enhanced")
-async def enhanced_health_check(db=Depends(get_db_connection)):
+async def enhanced_health_check(
+    exact: bool = False,
+    db=Depends(_get_connection_from_pool),
+    pool=Depends(_get_db_pool)
+):
     """Enhanced health check for new features"""
     try:
-        cursor = db.cursor()
-        
         # Check database tables
-        tables_to_check = [
-            'candidate_photos', 'candidate_manifestos', 'manifesto_pledges',
-            'tally_configurations', 'vote_commitments', 'pledge_ratings',
-            'tenant_configurations'
-        ]
+        tables_to_check = list(HEALTH_CHECK_TABLES)
+        
+        # Approximate row counts from the catalog avoid a full scan per table
+        count_query = """
+        SELECT relname, reltuples::bigint AS count
+        FROM pg_class
+        WHERE relname = ANY($1::text[]) AND relkind = 'r'
+          AND relnamespace = 'public'::regnamespace
+        """
+        
+        rows = await db.fetch(count_query, tables_to_check)
+        counts = {row['relname']: max(row['count'], 0) for row in rows}
+        
+        if exact:
+            # Exact counts scan each table, so run them in parallel across the pool
+            existing_tables = [table for table in tables_to_check if table in counts]
+            exact_counts = await asyncio.gather(*[
+                _exact_table_count(pool, table) for table in existing_tables
+            ])
+            counts.update(zip(existing_tables, exact_counts))
         
         table_status = {}
         for table in tables_to_check:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            table_status[table] = {"exists": True, "count": count}
+            table_status[table] = {"exists": table in counts, "count": counts.get(table, 0)}
         
         return {
             "status": "healthy",
@@ -0,0 +1,6 @@
+-- Manifesto Versioning Constraint
+-- Guarantees one row per (candidate, version) so concurrent manifesto
+-- creation cannot assign the same version number twice
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_manifesto_candidate_version
+    ON candidate_manifestos(candidate_id, version);
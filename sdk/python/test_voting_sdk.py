@@ -0,0 +1,244 @@
+"""
+Unit tests for the Python SDK helpers
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import voting_sdk
+from voting_sdk import VotingUtils
+
+
+def _results(*votes):
+    return [{'id': str(i), 'votes': v} for i, v in enumerate(votes)]
+
+
+class TestCalculatePercentages:
+    def test_percentages(self):
+        results = VotingUtils.calculate_percentages(_results(1, 1, 2))
+        assert [r['percentage'] for r in results] == [25.0, 25.0, 50.0]
+
+    def test_zero_votes(self):
+        results = VotingUtils.calculate_percentages(_results(0, 0))
+        assert [r['percentage'] for r in results] == [0, 0]
+
+    def test_does_not_mutate_input(self):
+        results = _results(3, 1)
+        VotingUtils.calculate_percentages(results)
+        assert 'percentage' not in results[0]
+
+    def test_exact_half_uses_round(self):
+        results = VotingUtils.calculate_percentages(_results(2441, 1559))
+        assert [r['percentage'] for r in results] == [61.02, 38.98]
+
+    def test_float_votes(self):
+        results = VotingUtils.calculate_percentages(_results(2.5, 1.25, 1.25))
+        assert [r['percentage'] for r in results] == [50.0, 25.0, 25.0]
+
+
+class TestFormatElection:
+    def test_returns_serializable_dict(self):
+        election = {'id': 'e1', 'startDate': '2024-01-01T00:00:00Z', 'endDate': '2099-01-01T00:00:00Z'}
+        formatted = VotingUtils.format_election(election)
+        assert type(formatted) is dict
+        assert formatted['id'] == 'e1'
+        assert formatted['isActive'] is True
+        assert json.loads(json.dumps(formatted, default=str))['id'] == 'e1'
+
+    def test_leaves_input_untouched(self):
+        election = {'startDate': '2024-01-01T00:00:00Z', 'endDate': '2099-01-01T00:00:00Z'}
+        VotingUtils.format_election(election)
+        assert election == {'startDate': '2024-01-01T00:00:00Z', 'endDate': '2099-01-01T00:00:00Z'}
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize('status', [429, 500, 502, 503, 504])
+    def test_post_is_never_retried(self, status):
+        assert not voting_sdk._RETRY.is_retry('POST', status)
+
+    @pytest.mark.parametrize('method', ['GET', 'PUT', 'DELETE'])
+    def test_idempotent_methods_are_retried(self, method):
+        assert voting_sdk._RETRY.is_retry(method, 503)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+
+class TestSyncRequest:
+    @pytest.fixture
+    def sdk(self):
+        return voting_sdk.VotingSDK('key', 'org', api_url='http://api.test')
+
+    def _respond(self, monkeypatch, sdk, status_code, content):
+        calls = []
+        
+        def fake_request(**kwargs):
+            calls.append(kwargs)
+            return _FakeResponse(status_code, content)
+        
+        monkeypatch.setattr(sdk.session, 'request', fake_request)
+        return calls
+
+    def test_encodes_json_body(self, monkeypatch, sdk):
+        calls = self._respond(monkeypatch, sdk, 200, b'{"success": true}')
+        assert sdk.update_election('e1', {'title': 'New'}) == {'success': True}
+        assert voting_sdk._loads(calls[0]['data']) == {'title': 'New'}
+        assert 'json' not in calls[0]
+
+    def test_empty_success_body_raises_sdk_error(self, monkeypatch, sdk):
+        self._respond(monkeypatch, sdk, 204, b'')
+        with pytest.raises(voting_sdk.VotingSDKError):
+            sdk.delete_election('e1')
+
+    def test_error_status_uses_server_message(self, monkeypatch, sdk):
+        self._respond(monkeypatch, sdk, 404, b'{"message": "Election not found"}')
+        with pytest.raises(voting_sdk.VotingSDKError) as excinfo:
+            sdk.get_election('e1')
+        assert str(excinfo.value) == 'Election not found'
+        assert excinfo.value.status_code == 404
+
+
+class TestHasVotedBulk:
+    @pytest.fixture
+    def sdk(self):
+        return voting_sdk.VotingSDK('key', 'org', api_url='http://api.test')
+
+    def _route(self, monkeypatch, sdk, bulk_status, bulk_body, voted=()):
+        calls = []
+        
+        def fake_request(**kwargs):
+            calls.append(kwargs)
+            if kwargs['url'].endswith('/voters/status'):
+                return _FakeResponse(bulk_status, bulk_body)
+            voter_id = kwargs['url'].rsplit('/', 2)[-2]
+            return _FakeResponse(200, json.dumps({'data': {'hasVoted': voter_id in voted}}).encode())
+        
+        monkeypatch.setattr(sdk.session, 'request', fake_request)
+        return calls
+
+    def test_single_bulk_request(self, monkeypatch, sdk):
+        calls = self._route(monkeypatch, sdk, 200, b'{"data": {"v1": true, "v2": false}}')
+        assert sdk.has_voted_bulk('e1', ['v1', 'v2']) == {'v1': True, 'v2': False}
+        assert len(calls) == 1
+        assert calls[0]['method'] == 'POST'
+        assert voting_sdk._loads(calls[0]['data']) == {'voterIds': ['v1', 'v2']}
+
+    def test_missing_data_raises_sdk_error(self, monkeypatch, sdk):
+        self._route(monkeypatch, sdk, 200, b'{"success": true}')
+        with pytest.raises(voting_sdk.VotingSDKError):
+            sdk.has_voted_bulk('e1', ['v1'])
+
+    @pytest.mark.parametrize('status', [404, 405])
+    def test_falls_back_to_has_voted(self, monkeypatch, sdk, status):
+        calls = self._route(monkeypatch, sdk, status, b'', voted={'v2'})
+        assert sdk.has_voted_bulk('e1', ['v1', 'v2', 'v3']) == {'v1': False, 'v2': True, 'v3': False}
+        assert sorted(call['url'] for call in calls[1:]) == [
+            f'http://api.test/elections/e1/voters/{voter_id}/status' for voter_id in ('v1', 'v2', 'v3')
+        ]
+
+    def test_other_errors_propagate(self, monkeypatch, sdk):
+        self._route(monkeypatch, sdk, 500, b'{"message": "boom"}')
+        with pytest.raises(voting_sdk.VotingSDKError) as excinfo:
+            sdk.has_voted_bulk('e1', ['v1'])
+        assert excinfo.value.status_code == 500
+
+    def test_no_voters(self, monkeypatch, sdk):
+        calls = self._route(monkeypatch, sdk, 200, b'{}')
+        assert sdk.has_voted_bulk('e1', []) == {}
+        assert calls == []
+
+
+class _FakeAsyncResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class _FakeAsyncSession:
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return _FakeAsyncResponse(self.status, self.body)
+
+
+class TestAsyncRequest:
+    @pytest.fixture(autouse=True)
+    def _needs_aiohttp(self):
+        pytest.importorskip('aiohttp')
+
+    def _run(self, status, body, call):
+        async def go():
+            sdk = voting_sdk.AsyncVotingSDK('key', 'org', api_url='http://api.test')
+            sdk._semaphore = asyncio.Semaphore(sdk.max_concurrency)
+            sdk._session = _FakeAsyncSession(status, body)
+            return await call(sdk), sdk._session.calls
+        return asyncio.run(go())
+
+    def test_returns_decoded_body(self):
+        result, calls = self._run(200, b'{"success": true}', lambda sdk: sdk.get_elections(active=True))
+        assert result == {'success': True}
+        assert calls[0][2]['params'] == {'active': 'True'}
+
+    def test_empty_success_body_raises_sdk_error(self):
+        with pytest.raises(voting_sdk.VotingSDKError):
+            self._run(204, b'', lambda sdk: sdk.delete_election('e1'))
+
+    def test_error_status_uses_server_message(self):
+        with pytest.raises(voting_sdk.VotingSDKError) as excinfo:
+            self._run(404, b'{"message": "Election not found"}', lambda sdk: sdk.get_election('e1'))
+        assert str(excinfo.value) == 'Election not found'
+        assert excinfo.value.status_code == 404
+
+    def test_empty_error_body(self):
+        with pytest.raises(voting_sdk.VotingSDKError) as excinfo:
+            self._run(502, b'', lambda sdk: sdk.get_election('e1'))
+        assert str(excinfo.value) == 'HTTP 502'
+        assert excinfo.value.status_code == 502
+
+    def test_has_voted_bare_404(self):
+        result, _ = self._run(404, b'', lambda sdk: sdk.has_voted('e1', 'v1'))
+        assert result is False
+
+
+class TestActiveElections:
+    ACTIVE = {'id': 'a', 'startDate': '2024-01-01T00:00:00Z', 'endDate': '2099-01-01T00:00:00Z'}
+    ENDED = {'id': 'b', 'startDate': '2000-01-01T00:00:00Z', 'endDate': '2001-01-01T00:00:00Z'}
+
+    def test_filter_active(self):
+        assert VotingUtils.filter_active([self.ACTIVE, self.ENDED]) == [self.ACTIVE]
+
+    def test_agrees_with_is_election_active(self):
+        now_ts = time.time()
+        for election in (self.ACTIVE, self.ENDED, {'startDate': 'bad', 'endDate': 'x'}, {}):
+            assert (VotingUtils.is_election_active_fast(election, now_ts=now_ts)
+                    == VotingUtils.is_election_active(election))
+
+    def test_follows_edited_dates(self):
+        election = dict(self.ACTIVE)
+        assert VotingUtils.filter_active([election]) == [election]
+        election['endDate'] = '2001-01-01T00:00:00Z'
+        assert VotingUtils.filter_active([election]) == []
+
+    def test_does_not_add_keys(self):
+        election = dict(self.ACTIVE)
+        VotingUtils.filter_active([election])
+        assert election == self.ACTIVE
@@ -4,15 +4,98 @@ Provides easy integration with the voting API
 Version: 1.0.0
 """
 
+import asyncio
+import functools
 import json
+import re
+import sys
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
-from urllib.parse import urlencode
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for AsyncVotingSDK
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # orjson only speeds up request/response (de)serialization
+    orjson = None
+
+
+# Worker threads used when has_voted_bulk falls back to per-voter requests
+_HAS_VOTED_FALLBACK_WORKERS = 16
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+# Defaults for VotingSDK's keep-alive connection pool
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+# One retry policy and adapter shared by every VotingSDK built with the pool
+# defaults, so short-lived SDK instances reuse the same connection pool.
+# POST is never retried: after a gateway error or read timeout the backend
+# may already have recorded the vote, and resending it could double-submit.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=frozenset({429, 500, 502, 503, 504}),
+    allowed_methods=frozenset({'GET', 'PUT', 'DELETE'}),
+)
+_ADAPTER = HTTPAdapter(
+    max_retries=_RETRY,
+    pool_connections=_POOL_CONNECTIONS,
+    pool_maxsize=_POOL_MAXSIZE,
+    pool_block=False
+)
+
+_REQUIRED_ELECTION_FIELDS = ('title', 'description', 'candidates', 'startDate', 'endDate')
+
+_EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively from 3.11
+    _parse_iso_raw = datetime.fromisoformat
+else:
+    def _parse_iso_raw(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp; memoized because the same dates are parsed repeatedly"""
+    return _parse_iso_raw(value)
+
+
+def _as_datetime(value: Union[str, datetime]) -> datetime:
+    """Return value as a datetime, parsing ISO-8601 strings"""
+    return value if isinstance(value, datetime) else _parse_iso(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_timestamp(value: str) -> float:
+    """POSIX timestamp of an ISO-8601 string; memoized so repeated activity checks are a lookup"""
+    return _parse_iso(value).timestamp()
+
+
+def _as_timestamp(value: Union[str, datetime]) -> float:
+    """Return value as a POSIX timestamp, parsing ISO-8601 strings"""
+    return value.timestamp() if isinstance(value, datetime) else _iso_timestamp(value)
+
 
 class VotingSDKError(Exception):
     """Custom exception for SDK errors"""
@@ -23,21 +106,12 @@ class VotingSDKError(Exception):
         self.details = details or {}
 
 
-class VotingSDK:
-    """Main SDK class for interacting with the Voting API"""
+class _BaseVotingSDK:
+    """Configuration and validation shared by the sync and async clients"""
     
     def __init__(self, api_key: str, organization_id: str, 
                  api_url: str = "https://api.voting-system.com/api/v1",
                  timeout: int = 10):
-        """
-        Initialize the Voting SDK
-        
-        Args:
-            api_key: Your API key
-            organization_id: Your organization ID
-            api_url: Base API URL
-            timeout: Request timeout in seconds
-        """
         if not api_key:
             raise VotingSDKError("API key is required")
         
@@ -48,42 +122,107 @@ class VotingSDK:
         self.api_key = api_key
         self.organization_id = organization_id
         self.timeout = timeout
-        
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Default headers
-        self.session.headers.update({
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request"""
+        return {
             'Content-Type': 'application/json',
             'X-API-Key': self.api_key,
             'X-Organization-ID': self.organization_id,
             'User-Agent': 'VotingSDK-Python/1.0.0'
-        })
+        }
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
+    def _validate_election_data(self, data: Dict) -> None:
+        """Validate election data"""
+        for field in _REQUIRED_ELECTION_FIELDS:
+            if not data.get(field):
+                raise VotingSDKError(f"Missing required field: {field}")
+
+        candidates = data.get('candidates', [])
+        if not isinstance(candidates, list) or len(candidates) < 2:
+            raise VotingSDKError("At least 2 candidates are required")
+
+        try:
+            start_date = _parse_iso(data['startDate'])
+            end_date = _parse_iso(data['endDate'])
+            
+            if start_date >= end_date:
+                raise VotingSDKError("End date must be after start date")
+        except ValueError as e:
+            raise VotingSDKError(f"Invalid date format: {str(e)}")
+
+    def _validate_vote_data(self, data: Dict) -> None:
+        """Validate vote data"""
+        if not data.get('candidateId'):
+            raise VotingSDKError("Candidate ID is required")
+        
+        if not data.get('voterId'):
+            raise VotingSDKError("Voter ID is required")
+
+
+class VotingSDK(_BaseVotingSDK):
+    """Main SDK class for interacting with the Voting API"""
+    
+    def __init__(self, api_key: str, organization_id: str, 
+                 api_url: str = "https://api.voting-system.com/api/v1",
+                 timeout: int = 10, session: Optional[requests.Session] = None,
+                 pool_connections: int = _POOL_CONNECTIONS, pool_maxsize: int = _POOL_MAXSIZE):
+        """
+        Initialize the Voting SDK
+        
+        Args:
+            api_key: Your API key
+            organization_id: Your organization ID
+            api_url: Base API URL
+            timeout: Request timeout in seconds
+            session: Pre-configured requests.Session to use instead of creating one
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections kept per host
+        """
+        super().__init__(api_key, organization_id, api_url, timeout)
+        
+        # Setup session with retry strategy and a keep-alive connection pool
+        if session is None:
+            session = requests.Session()
+            if (pool_connections, pool_maxsize) == (_POOL_CONNECTIONS, _POOL_MAXSIZE):
+                adapter = _ADAPTER
+            else:
+                adapter = HTTPAdapter(
+                    max_retries=_RETRY,
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=False
+                )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        
+        # Default headers
+        self.session.headers.update(self._default_headers())
+        self.session.headers['Connection'] = 'keep-alive'
+
+    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict:
         """Make authenticated API request"""
         url = f"{self.api_url}{endpoint}"
         
+        # Encode bodies ourselves; the session already sends Content-Type: application/json
+        if 'json' in kwargs:
+            kwargs['data'] = _dumps(kwargs.pop('json'))
+        
         try:
             response = self.session.request(
                 method=method,
                 url=url,
+                params=params,
                 timeout=self.timeout,
                 **kwargs
             )
             
-            if not response.ok:
+            # Same test as response.ok, without raising and catching an HTTPError
+            if response.status_code >= 400:
                 try:
-                    error_data = response.json()
-                except json.JSONDecodeError:
+                    error_data = _loads(response.content)
+                except ValueError:
                     error_data = {}
                 
                 raise VotingSDKError(
@@ -92,7 +231,13 @@ class VotingSDK:
                     error_data
                 )
             
-            return response.json()
+            try:
+                payload = _loads(response.content)
+            except ValueError as e:
+                # Non-JSON or empty (e.g. 204) bodies surface as SDK errors, as response.json()'s did
+                raise VotingSDKError(f"Request error: {str(e)}", 0)
+            
+            return payload
             
         except requests.exceptions.Timeout:
             raise VotingSDKError("Request timeout", 408)
@@ -112,9 +257,8 @@ class VotingSDK:
             Dict containing elections data
         """
         params = {k: v for k, v in filters.items() if v is not None}
-        query_string = f"?{urlencode(params)}" if params else ""
         
-        return self._request('GET', f'/elections{query_string}')
+        return self._request('GET', '/elections', params=params)
 
     def get_election(self, election_id: str) -> Dict:
         """
@@ -246,6 +390,43 @@ class VotingSDK:
                 return False
             raise
 
+    def has_voted_bulk(self, election_id: str, voter_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check whether each of several voters has voted, in one request
+        
+        Falls back to concurrent has_voted calls over the pooled session when
+        the server does not expose the bulk status endpoint.
+        
+        Args:
+            election_id: Election ID
+            voter_ids: Voter IDs to check
+            
+        Returns:
+            Dict mapping each voter ID to whether they have voted
+        """
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        if not voter_ids:
+            return {}
+        
+        try:
+            result = self._request('POST', f'/elections/{election_id}/voters/status',
+                                   json={'voterIds': list(voter_ids)})
+        except VotingSDKError as e:
+            if e.status_code not in (404, 405):
+                raise
+        else:
+            statuses = result.get('data')
+            if statuses is None:
+                raise VotingSDKError("Bulk status response has no data", 0, result)
+            return statuses
+        
+        workers = min(_HAS_VOTED_FALLBACK_WORKERS, len(voter_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            statuses = executor.map(functools.partial(self.has_voted, election_id), voter_ids)
+            return dict(zip(voter_ids, statuses))
+
     def get_health(self) -> Dict:
         """
         Get API health status
@@ -255,34 +436,189 @@ class VotingSDK:
         """
         return self._request('GET', '/health')
 
-    def _validate_election_data(self, data: Dict) -> None:
-        """Validate election data"""
-        required_fields = ['title', 'description', 'candidates', 'startDate', 'endDate']
-        missing_fields = [field for field in required_fields if not data.get(field)]
+
+class AsyncVotingSDK(_BaseVotingSDK):
+    """Asyncio SDK class for issuing many Voting API calls concurrently"""
+    
+    def __init__(self, api_key: str, organization_id: str, 
+                 api_url: str = "https://api.voting-system.com/api/v1",
+                 timeout: int = 10, max_concurrency: int = 8,
+                 connection_limit: int = 32):
+        """
+        Initialize the async Voting SDK
+        
+        Use as an async context manager so the HTTP session is opened and
+        closed once:
         
-        if missing_fields:
-            raise VotingSDKError(f"Missing required fields: {', '.join(missing_fields)}")
+            async with AsyncVotingSDK(api_key, org_id) as sdk:
+                elections = await sdk.get_elections(status="active")
+        
+        Args:
+            api_key: Your API key
+            organization_id: Your organization ID
+            api_url: Base API URL
+            timeout: Request timeout in seconds
+            max_concurrency: Maximum number of requests in flight at once
+            connection_limit: Maximum number of pooled TCP connections
+        """
+        if aiohttp is None:
+            raise VotingSDKError("aiohttp is required for AsyncVotingSDK (pip install aiohttp)")
+        
+        super().__init__(api_key, organization_id, api_url, timeout)
+        self.max_concurrency = max_concurrency
+        self.connection_limit = connection_limit
+        self._semaphore = None
+        self._session = None
 
-        candidates = data.get('candidates', [])
-        if not isinstance(candidates, list) or len(candidates) < 2:
-            raise VotingSDKError("At least 2 candidates are required")
+    async def __aenter__(self) -> 'AsyncVotingSDK':
+        # Created here so it binds to the running loop (Python < 3.10 binds at construction)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = aiohttp.ClientSession(
+            headers=self._default_headers(),
+            json_serialize=lambda obj: _dumps(obj).decode(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.connection_limit)
+        )
+        return self
 
-        try:
-            start_date = datetime.fromisoformat(data['startDate'].replace('Z', '+00:00'))
-            end_date = datetime.fromisoformat(data['endDate'].replace('Z', '+00:00'))
-            
-            if start_date >= end_date:
-                raise VotingSDKError("End date must be after start date")
-        except ValueError as e:
-            raise VotingSDKError(f"Invalid date format: {str(e)}")
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
-    def _validate_vote_data(self, data: Dict) -> None:
-        """Validate vote data"""
-        if not data.get('candidateId'):
-            raise VotingSDKError("Candidate ID is required")
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """Make authenticated API request"""
+        if self._session is None:
+            raise VotingSDKError("Session not started; use 'async with AsyncVotingSDK(...)'")
         
-        if not data.get('voterId'):
+        url = f"{self.api_url}{endpoint}"
+        
+        async with self._semaphore:
+            try:
+                async with self._session.request(method, url, **kwargs) as response:
+                    # Read raw bytes so empty bodies fail to decode as in the sync client
+                    # (response.json() returns None for them)
+                    body = await response.read()
+                
+                if response.status >= 400:
+                    try:
+                        error_data = _loads(body)
+                    except ValueError:
+                        error_data = {}
+                    
+                    raise VotingSDKError(
+                        error_data.get('message', f'HTTP {response.status}'),
+                        response.status,
+                        error_data
+                    )
+                
+                try:
+                    return _loads(body)
+                except ValueError as e:
+                    raise VotingSDKError(f"Request error: {str(e)}", 0)
+                
+            except asyncio.TimeoutError:
+                raise VotingSDKError("Request timeout", 408)
+            except aiohttp.ClientConnectionError:
+                raise VotingSDKError("Connection error", 0)
+            except aiohttp.ClientError as e:
+                raise VotingSDKError(f"Request error: {str(e)}", 0)
+
+    async def get_elections(self, **filters) -> Dict:
+        """Get all elections with optional filtering"""
+        # aiohttp rejects non-str values such as bools; stringify like requests does
+        params = {k: str(v) for k, v in filters.items() if v is not None}
+        
+        return await self._request('GET', '/elections', params=params)
+
+    async def get_election(self, election_id: str) -> Dict:
+        """Get specific election by ID"""
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        return await self._request('GET', f'/elections/{election_id}')
+
+    async def create_election(self, election_data: Dict) -> Dict:
+        """Create new election"""
+        self._validate_election_data(election_data)
+        
+        return await self._request('POST', '/elections', json=election_data)
+
+    async def update_election(self, election_id: str, updates: Dict) -> Dict:
+        """Update election"""
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        return await self._request('PUT', f'/elections/{election_id}', json=updates)
+
+    async def delete_election(self, election_id: str) -> Dict:
+        """Delete election"""
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        return await self._request('DELETE', f'/elections/{election_id}')
+
+    async def cast_vote(self, election_id: str, vote_data: Dict) -> Dict:
+        """Cast vote in election"""
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        self._validate_vote_data(vote_data)
+        
+        return await self._request('POST', f'/elections/{election_id}/vote', json=vote_data)
+
+    async def get_results(self, election_id: str) -> Dict:
+        """Get election results"""
+        if not election_id:
+            raise VotingSDKError("Election ID is required")
+        
+        return await self._request('GET', f'/elections/{election_id}/results')
+
+    async def get_vote_history(self, voter_id: str) -> Dict:
+        """Get voter's vote history"""
+        if not voter_id:
             raise VotingSDKError("Voter ID is required")
+        
+        return await self._request('GET', f'/voters/{voter_id}/votes')
+
+    async def has_voted(self, election_id: str, voter_id: str) -> bool:
+        """Check if voter has voted in election"""
+        if not election_id or not voter_id:
+            raise VotingSDKError("Election ID and Voter ID are required")
+        
+        try:
+            result = await self._request('GET', f'/elections/{election_id}/voters/{voter_id}/status')
+            return result.get('data', {}).get('hasVoted', False)
+        except VotingSDKError as e:
+            if e.status_code == 404:
+                return False
+            raise
+
+    async def gather_has_voted(self, election_id: str, voter_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check many voters concurrently
+        
+        Requests run in parallel, bounded by max_concurrency.
+        
+        Args:
+            election_id: Election ID
+            voter_ids: Voter IDs to check
+            
+        Returns:
+            Dict mapping each voter ID to whether they have voted
+        """
+        statuses = await asyncio.gather(*[
+            self.has_voted(election_id, voter_id) for voter_id in voter_ids
+        ])
+        return dict(zip(voter_ids, statuses))
+
+    async def get_health(self) -> Dict:
+        """Get API health status"""
+        return await self._request('GET', '/health')
 
 
 class VotingUtils:
@@ -291,39 +627,52 @@ class VotingUtils:
     @staticmethod
     def format_election(election: Dict) -> Dict:
         """Format election for display"""
-        formatted = election.copy()
+        overrides = {}
         
         try:
-            formatted['startDate'] = datetime.fromisoformat(
-                election['startDate'].replace('Z', '+00:00')
-            )
-            formatted['endDate'] = datetime.fromisoformat(
-                election['endDate'].replace('Z', '+00:00')
-            )
-            formatted['isActive'] = VotingUtils.is_election_active(election)
-            formatted['timeRemaining'] = VotingUtils.get_time_remaining(election['endDate'])
+            # Parse once and hand the datetimes to the helpers below
+            overrides['startDate'] = _parse_iso(election['startDate'])
+            overrides['endDate'] = _parse_iso(election['endDate'])
+            overrides['isActive'] = VotingUtils.is_election_active(overrides)
+            overrides['timeRemaining'] = VotingUtils.get_time_remaining(overrides['endDate'])
         except (ValueError, KeyError):
             pass
         
-        return formatted
+        # One allocation for the merged dict; the input is left untouched
+        return {**election, **overrides}
 
     @staticmethod
     def is_election_active(election: Dict) -> bool:
-        """Check if election is currently active"""
+        """Check if election is currently active (dates may be ISO strings or datetimes)"""
         try:
             now = datetime.now(timezone.utc)
-            start = datetime.fromisoformat(election['startDate'].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(election['endDate'].replace('Z', '+00:00'))
+            start = _as_datetime(election['startDate'])
+            end = _as_datetime(election['endDate'])
             return start <= now <= end
         except (ValueError, KeyError):
             return False
 
     @staticmethod
-    def get_time_remaining(end_date: str) -> Optional[Dict]:
+    def is_election_active_fast(election: Dict, *, now_ts: float) -> bool:
+        """Check if election is active at now_ts (a POSIX timestamp) using cached date timestamps"""
+        try:
+            return _as_timestamp(election['startDate']) <= now_ts <= _as_timestamp(election['endDate'])
+        except (ValueError, KeyError):
+            return False
+
+    @staticmethod
+    def filter_active(elections: List[Dict]) -> List[Dict]:
+        """Return the elections that are currently active, reading the clock once"""
+        now_ts = time.time()
+        is_active = VotingUtils.is_election_active_fast
+        return [election for election in elections if is_active(election, now_ts=now_ts)]
+
+    @staticmethod
+    def get_time_remaining(end_date: Union[str, datetime]) -> Optional[Dict]:
         """Get time remaining in election"""
         try:
             now = datetime.now(timezone.utc)
-            end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            end = _as_datetime(end_date)
             diff = end - now
             
             if diff.total_seconds() <= 0:
@@ -361,16 +710,13 @@ class VotingUtils:
     @staticmethod
     def is_valid_email(email: str) -> bool:
         """Validate email format"""
-        import re
-        pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def generate_voter_id(prefix: str = "voter") -> str:
         """Generate unique voter ID"""
-        import uuid
-        timestamp = int(time.time())
-        unique_id = str(uuid.uuid4())[:8]
+        timestamp = time.time_ns() // 1_000_000_000
+        unique_id = uuid.uuid4().hex[:8]
         return f"{prefix}_{timestamp}_{unique_id}"
 
 